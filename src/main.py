@@ -3,13 +3,36 @@ import sys
 # DON'T CHANGE THIS !!!
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
+import orjson
 from flask import Flask, send_from_directory
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 from src.models.user import db
 from src.routes.user import user_bp
-from src.routes.uniswap import uniswap_bp
+
+# Both modules define the same routes on a blueprint named "uniswap", so
+# exactly one of them may be imported. The mock variant skips Web3 setup
+# and ABI loading entirely, which is useful for dev/CI without RPC access.
+if os.environ.get('MOCK_MODE') == '1':
+    from src.routes.uniswap_simple import uniswap_bp
+else:
+    from src.routes.uniswap import uniswap_bp
+
+class ORJSONProvider(DefaultJSONProvider):
+    """Serialize responses with orjson, falling back to the stdlib encoder.
+
+    orjson cannot represent integers beyond 64 bits, which wei amounts and
+    token supplies routinely exceed, so those payloads take the fallback.
+    """
+    def dumps(self, obj, **kwargs):
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS).decode()
+        except TypeError:
+            return super().dumps(obj, **kwargs)
+
 
 app = Flask(__name__, static_folder=os.path.join(os.path.dirname(__file__), 'static'))
+app.json = ORJSONProvider(app)
 app.config['SECRET_KEY'] = 'asdf#FGSgvasgf$5$WGT'
 
 # Enable CORS for all routes
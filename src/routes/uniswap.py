@@ -1,9 +1,18 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+from eth_abi import encode as abi_encode
+from eth_account.datastructures import SignedTransaction
 from flask import Blueprint, jsonify, request
+from functools import lru_cache
 from web3 import Web3
 from web3.middleware import ExtraDataToPOAMiddleware
-import json
 import logging
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import threading
 import time
 
 # Configure logging
@@ -14,22 +23,29 @@ uniswap_bp = Blueprint("uniswap", __name__)
 
 # Configuration
 CONTRACT_ADDRESS = "0xad8c787992428cD158E451aAb109f724B6bc36de"  # ASPECTA token
-BNB_CHAIN_RPC = "https://bsc-dataseed.binance.org/"
+BNB_CHAIN_RPC = os.environ.get("BNB_CHAIN_RPC", "https://bsc-dataseed.binance.org/")
 WBNB_ADDRESS = "0xbb4CdB9CBd36B01bD1cBaEBF2De08d9173bc095c"
 PANCAKESWAP_V3_FACTORY_ADDRESS = "0x0BFbCF9fa4f9C56B0F40a671Ad40E0805A091865"
 PANCAKESWAP_V3_ROUTER_ADDRESS = "0x13f4EA83D0bd40E75C8222255bc855a974568Dd4"
 PANCAKESWAP_V3_QUOTER_ADDRESS = "0xB048Bbc1Ee6b733FFfCFb9e9CeF7375518e25997"
 
+# Wei per whole token (both ASPECTA and WBNB use 18 decimals)
+WEI = 10 ** 18
+
 # Load ABIs
+@lru_cache(maxsize=None)
 def load_abi(filename):
     # The ABI files are directly in the 'src' directory, which is the parent of 'routes'
     abi_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), filename)
-    with open(abi_path, "r") as f:
-        return json.load(f)
+    with open(abi_path, "rb") as f:
+        return orjson.loads(f.read())
+
+def filter_abi(abi, fn_names):
+    # web3's .functions lookup scans the ABI linearly per access, so keep
+    # only the functions this module actually calls
+    return [entry for entry in abi if entry.get("name") in fn_names]
 
-ERC20_ABI = load_abi("ERC20_ABI.json")
-QUOTER_V2_ABI = load_abi("IQuoterV2_abi.json")
-ROUTER_ABI = load_abi("UniversalRouter_abi.json")
+ERC20_ABI = filter_abi(load_abi("ERC20_ABI.json"), {"name", "symbol", "decimals", "totalSupply"})
 
 # PancakeSwap V3 Factory ABI (simplified)
 PANCAKESWAP_V3_FACTORY_ABI = [
@@ -46,36 +62,195 @@ PANCAKESWAP_V3_FACTORY_ABI = [
     }
 ]
 
-# Initialize Web3
+# Multicall3 is deployed at the same address on BSC (and most chains)
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+# Multicall3 ABI (aggregate3 only)
+MULTICALL3_ABI = [
+    {
+        "inputs": [
+            {
+                "components": [
+                    {"internalType": "address", "name": "target", "type": "address"},
+                    {"internalType": "bool", "name": "allowFailure", "type": "bool"},
+                    {"internalType": "bytes", "name": "callData", "type": "bytes"}
+                ],
+                "internalType": "struct Multicall3.Call3[]",
+                "name": "calls",
+                "type": "tuple[]"
+            }
+        ],
+        "name": "aggregate3",
+        "outputs": [
+            {
+                "components": [
+                    {"internalType": "bool", "name": "success", "type": "bool"},
+                    {"internalType": "bytes", "name": "returnData", "type": "bytes"}
+                ],
+                "internalType": "struct Multicall3.Result[]",
+                "name": "returnData",
+                "type": "tuple[]"
+            }
+        ],
+        "stateMutability": "payable",
+        "type": "function"
+    }
+]
+
+# Initialize Web3 over a pooled keep-alive session so concurrent requests
+# reuse TCP+TLS connections instead of paying a handshake per RPC
 logger.info(f"Initializing Web3 with RPC: {BNB_CHAIN_RPC}")
-w3 = Web3(Web3.HTTPProvider(BNB_CHAIN_RPC))
+rpc_session = requests.Session()
+rpc_adapter = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=64,
+    # allowed_methods=None makes the policy cover POST -- every JSON-RPC call
+    # is one, and retrying is safe here (eth_call/eth_gasPrice are idempotent
+    # and re-broadcasting identical signed raw-tx bytes is harmless)
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.2,
+        status_forcelist=[429, 502, 503, 504],
+        allowed_methods=None,
+    ),
+)
+rpc_session.mount("https://", rpc_adapter)
+rpc_session.mount("http://", rpc_adapter)
+w3 = Web3(Web3.HTTPProvider(BNB_CHAIN_RPC, session=rpc_session, request_kwargs={"timeout": 10}))
 w3.middleware_onion.inject(ExtraDataToPOAMiddleware, layer=0)
 
-# Test Web3 connection on startup
-try:
-    is_connected = w3.is_connected()
-    chain_id = w3.eth.chain_id if is_connected else None
-    logger.info(f"Web3 connection status: {is_connected}, Chain ID: {chain_id}")
-except Exception as e:
-    logger.error(f"Web3 connection test failed: {e}")
+# Checksummed addresses and contract singletons. The inputs are fixed at
+# import time, so pay for the checksum hashing and ABI parsing once here
+# instead of on every request.
+TOKEN_ADDR = w3.to_checksum_address(CONTRACT_ADDRESS)
+WBNB_ADDR = w3.to_checksum_address(WBNB_ADDRESS)
+FACTORY_ADDR = w3.to_checksum_address(PANCAKESWAP_V3_FACTORY_ADDRESS)
+ROUTER_ADDR = w3.to_checksum_address(PANCAKESWAP_V3_ROUTER_ADDRESS)
+QUOTER_ADDR = w3.to_checksum_address(PANCAKESWAP_V3_QUOTER_ADDRESS)
+MULTICALL3_ADDR = w3.to_checksum_address(MULTICALL3_ADDRESS)
+
+TOKEN_CONTRACT = w3.eth.contract(address=TOKEN_ADDR, abi=ERC20_ABI)
+FACTORY_CONTRACT = w3.eth.contract(address=FACTORY_ADDR, abi=PANCAKESWAP_V3_FACTORY_ABI)
+MULTICALL3_CONTRACT = w3.eth.contract(address=MULTICALL3_ADDR, abi=MULTICALL3_ABI)
+
+# Pre-bound functions for the calls still made per request -- skips the ABI
+# walk behind .functions.<name> on every access
+AGGREGATE3_FN = MULTICALL3_CONTRACT.get_function_by_name("aggregate3")
+TOTAL_SUPPLY_FN = TOKEN_CONTRACT.get_function_by_name("totalSupply")
+
+# Pre-resolved selector and struct type for the router's exactInputSingle so
+# the swap path skips ABI grammar parsing per request. The deployed router
+# exposes this function even though the bundled UniversalRouter ABI does not
+# list it, so the calldata is built directly with eth_abi.
+EXACT_INPUT_SINGLE_TYPE = "(address,address,uint24,address,uint256,uint256,uint160)"
+EXACT_INPUT_SINGLE_SELECTOR = Web3.keccak(text=f"exactInputSingle({EXACT_INPUT_SINGLE_TYPE})")[:4]
+APPROVE_SELECTOR = Web3.keccak(text="approve(address,uint256)")[:4]
+
+# Quote calldata is likewise built by hand against the canonical QuoterV2
+# params layout (amountIn before fee). The bundled IQuoterV2 ABI declared the
+# struct with fee third, which does not match the deployed quoter, so
+# encoding directly also fixes the wire format.
+QUOTE_SINGLE_TYPE = "(address,address,uint256,uint24,uint160)"
+QUOTE_SINGLE_SELECTOR = Web3.keccak(text=f"quoteExactInputSingle({QUOTE_SINGLE_TYPE})")[:4]
+
+# eth-account renamed rawTransaction to raw_transaction in v0.13; resolve the
+# attribute name once at import instead of probing on every request
+RAW_TX_ATTR = "raw_transaction" if hasattr(SignedTransaction, "raw_transaction") else "rawTransaction"
+
+# Locally tracked nonces per account: the first transaction for an address
+# syncs with the node, later ones just increment, skipping one RPC per
+# submission. Failed sends evict the entry so the next call re-syncs.
+_NONCES = {}
+_NONCE_LOCK = threading.Lock()
+
+def next_nonce(account_address):
+    """Reserve the next nonce for an account, syncing from the node on first use"""
+    with _NONCE_LOCK:
+        if account_address in _NONCES:
+            nonce = _NONCES[account_address]
+            _NONCES[account_address] = nonce + 1
+            return nonce
+    # First use for this account: sync from the node without holding the lock
+    # so a slow RPC does not stall nonce reservation for other accounts.
+    synced = w3.eth.get_transaction_count(account_address, "pending")
+    with _NONCE_LOCK:
+        nonce = _NONCES.setdefault(account_address, synced)
+        _NONCES[account_address] = nonce + 1
+        return nonce
+
+def reset_nonce(account_address):
+    """Drop the cached nonce after a failure so the next call re-syncs"""
+    with _NONCE_LOCK:
+        _NONCES.pop(account_address, None)
+
+# Shared pool for firing independent RPCs concurrently within one request
+_rpc_executor = ThreadPoolExecutor(max_workers=8)
+
+_GAS_PRICE_CACHE = {"price": 0, "ts": 0.0}
+
+@lru_cache(maxsize=1)
+def get_chain_id():
+    """chain_id never changes for a given endpoint -- fetch it once"""
+    return w3.eth.chain_id
+
+def get_gas_price():
+    """Gas price only moves per block (~3s on BSC), so a 2s TTL cache is safe"""
+    now = time.monotonic()
+    if now - _GAS_PRICE_CACHE["ts"] > 2.0:
+        _GAS_PRICE_CACHE.update(price=w3.eth.gas_price, ts=now)
+    return _GAS_PRICE_CACHE["price"]
+
+def error_status(exc):
+    """503 when the RPC node is unreachable, 500 for everything else"""
+    return 503 if isinstance(exc, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)) else 500
+
+def to_wei(amount):
+    """Convert a user-supplied token amount to wei exactly (no float drift)"""
+    return int(Decimal(str(amount)) * WEI)
+
+def encode_call(contract, fn_name, args=None):
+    """Encode a contract function call into raw calldata bytes for Multicall3"""
+    return bytes.fromhex(contract.encode_abi(fn_name, args=args)[2:])
+
+def multicall3(calls):
+    """Execute a list of (target, allow_failure, calldata) tuples in a single aggregate3 RPC"""
+    return AGGREGATE3_FN(calls).call()
+
+@lru_cache(maxsize=1)
+def get_token_metadata(token_address):
+    """Fetch name/symbol/decimals once -- they never change for a deployed ERC20"""
+    calls = [
+        (token_address, False, encode_call(TOKEN_CONTRACT, "name")),
+        (token_address, False, encode_call(TOKEN_CONTRACT, "symbol")),
+        (token_address, False, encode_call(TOKEN_CONTRACT, "decimals")),
+    ]
+    name_ret, symbol_ret, decimals_ret = multicall3(calls)
+    return (
+        w3.codec.decode(["string"], name_ret[1])[0],
+        w3.codec.decode(["string"], symbol_ret[1])[0],
+        w3.codec.decode(["uint8"], decimals_ret[1])[0],
+    )
+
+_TOTAL_SUPPLY_CACHE = {"value": None, "ts": 0.0}
+
+def get_total_supply():
+    """totalSupply only drifts on mint/burn, so serve it from a 30s TTL cache"""
+    now = time.monotonic()
+    if _TOTAL_SUPPLY_CACHE["value"] is None or now - _TOTAL_SUPPLY_CACHE["ts"] > 30.0:
+        _TOTAL_SUPPLY_CACHE.update(value=TOTAL_SUPPLY_FN().call(), ts=now)
+    return _TOTAL_SUPPLY_CACHE["value"]
 
 @uniswap_bp.route("/token-info", methods=["GET"])
 def get_token_info():
     """Get ASPECTA token information"""
     logger.info("Token info request received")
     try:
-        if not w3.is_connected():
-            logger.error("Web3 not connected for token info")
-            return jsonify({"error": "Failed to connect to BNB Smart Chain"}), 500
-
-        token_contract = w3.eth.contract(address=w3.to_checksum_address(CONTRACT_ADDRESS), abi=ERC20_ABI)
+        # Immutable metadata is cached forever, totalSupply for 30s, so a
+        # warm request costs zero RPCs
+        name, symbol, decimals = get_token_metadata(TOKEN_ADDR)
+        total_supply = get_total_supply()
 
-        name = token_contract.functions.name().call()
-        symbol = token_contract.functions.symbol().call()
-        decimals = token_contract.functions.decimals().call()
-        total_supply = token_contract.functions.totalSupply().call()
-
-        logger.info(f"Token info retrieved successfully: {name} ({symbol})")
+        logger.info("Token info retrieved successfully: %s (%s)", name, symbol)
         return jsonify({
             "address": CONTRACT_ADDRESS,
             "name": name,
@@ -86,42 +261,64 @@ def get_token_info():
         })
     except Exception as e:
         logger.exception("Error getting token info")
-        return jsonify({"error": str(e)}), 500
+        return jsonify({"error": str(e)}), error_status(e)
+
+@lru_cache(maxsize=16)
+def get_pools(token_address, wbnb_address):
+    """Look up the V3 pool address for every fee tier in one batched call.
+
+    Pool addresses are immutable once the factory deploys them, so results
+    are memoized for the life of the process. Returns ((fee, address), ...)
+    for the tiers where a pool exists.
+    """
+    # PancakeSwap V3 fee tiers
+    fee_tiers = [100, 500, 2500, 10000]  # 0.01%, 0.05%, 0.25%, 1%
+
+    # Batch the existence check for every fee tier into one Multicall3 round-trip
+    calls = [
+        (FACTORY_ADDR, False, encode_call(FACTORY_CONTRACT, "getPool", [token_address, wbnb_address, fee]))
+        for fee in fee_tiers
+    ]
+    results = multicall3(calls)
+
+    pools = []
+    for fee, (_, return_data) in zip(fee_tiers, results):
+        pool_address = w3.codec.decode(["address"], return_data)[0]
+        # the zero address parses to 0, i.e. no pool for this tier
+        if int(pool_address, 16):
+            pools.append((fee, w3.to_checksum_address(pool_address)))
+    return tuple(pools)
+
+@uniswap_bp.route("/clear-cache", methods=["POST"])
+def clear_cache():
+    """Drop all memoized chain state so the next requests re-fetch from the node"""
+    get_token_metadata.cache_clear()
+    get_pools.cache_clear()
+    get_chain_id.cache_clear()
+    _TOTAL_SUPPLY_CACHE.update(value=None, ts=0.0)
+    _GAS_PRICE_CACHE.update(price=0, ts=0.0)
+    with _NONCE_LOCK:
+        _NONCES.clear()
+    logger.info("All cached chain state cleared")
+    return jsonify({"success": True})
 
 @uniswap_bp.route("/pool-info", methods=["GET"])
 def get_pool_info():
     """Find PancakeSwap V3 pools for the token paired with WBNB"""
     logger.info("Pool info request received")
     try:
-        if not w3.is_connected():
-            logger.error("Web3 not connected for pool info")
-            return jsonify({"error": "Failed to connect to BNB Smart Chain"}), 500
-        
-        factory_contract = w3.eth.contract(
-            address=PANCAKESWAP_V3_FACTORY_ADDRESS,
-            abi=PANCAKESWAP_V3_FACTORY_ABI
-        )
-        
-        token_address = w3.to_checksum_address(CONTRACT_ADDRESS)
-        wbnb_address = w3.to_checksum_address(WBNB_ADDRESS)
-        
-        # PancakeSwap V3 fee tiers
-        fee_tiers = [100, 500, 2500, 10000]  # 0.01%, 0.05%, 0.25%, 1%
-        
-        found_pools = []
-        for fee in fee_tiers:
-            # Check pool existence
-            pool_address = factory_contract.functions.getPool(token_address, wbnb_address, fee).call()
-            if pool_address != "0x0000000000000000000000000000000000000000":
-                found_pools.append({
-                    "address": pool_address,
-                    "fee": fee,
-                    "fee_percentage": f"{fee/10000}%",
-                    "pair": "ASPECTA-WBNB",
-                    "dex": "PancakeSwap V3"
-                })
+        found_pools = [
+            {
+                "address": pool_address,
+                "fee": fee,
+                "fee_percentage": f"{fee/10000}%",
+                "pair": "ASPECTA-WBNB",
+                "dex": "PancakeSwap V3"
+            }
+            for fee, pool_address in get_pools(TOKEN_ADDR, WBNB_ADDR)
+        ]
         
-        logger.info(f"Found {len(found_pools)} pools")
+        logger.info("Found %d pools", len(found_pools))
         return jsonify({
             "pools_found": len(found_pools),
             "pools": found_pools,
@@ -130,7 +327,7 @@ def get_pool_info():
         })
     except Exception as e:
         logger.exception("Error getting pool info")
-        return jsonify({"error": str(e)}), 500
+        return jsonify({"error": str(e)}), error_status(e)
 
 @uniswap_bp.route("/quote", methods=["POST"])
 def get_quote():
@@ -139,118 +336,99 @@ def get_quote():
     logger.info("Quote request received")
     
     try:
-        # Log environment info
-        logger.info(f"Environment check - Web3 connected: {w3.is_connected()}")
-        if w3.is_connected():
-            logger.info(f"Chain ID: {w3.eth.chain_id}")
-            logger.info(f"Latest block: {w3.eth.block_number}")
-        
         data = request.get_json()
         amount_in = data.get("amount_in")
         fee = data.get("fee", 10000)  # Default to 1% fee tier as it has liquidity
         
-        logger.info(f"Request data: amount_in={amount_in}, fee={fee}, type(fee)={type(fee)}")
+        logger.debug("Request data: amount_in=%s, fee=%s", amount_in, fee)
 
         if not amount_in:
             logger.error("amount_in is required")
             return jsonify({"error": "amount_in is required"}), 400
-        
-        if not w3.is_connected():
-            logger.error("Failed to connect to BNB Smart Chain")
-            return jsonify({
-                "error": "Failed to connect to BNB Smart Chain",
-                "debug_info": {
-                    "rpc_endpoint": BNB_CHAIN_RPC,
-                    "connection_test": False
-                }
-            }), 500
-        
+
+        # Amounts may legitimately arrive as strings for exact wei conversion
+        # (to_wei goes through Decimal), so coerce once for the display math;
+        # fee tiers are compared and encoded as ints
+        amount_in_num = float(amount_in)
+        fee = int(fee)
+        if amount_in_num <= 0:
+            return jsonify({"error": "amount_in must be greater than zero"}), 400
+
         # Convert amount to wei (18 decimals for ASPECTA)
-        amount_in_wei = int(amount_in * (10 ** 18))
-        logger.info(f"Converted amount_in to wei: {amount_in_wei}")
+        amount_in_wei = to_wei(amount_in)
+        logger.debug("Converted amount_in to wei: %s", amount_in_wei)
+
+        # Try different fee tiers in order of preference (1% has liquidity)
+        fee_tiers_to_try = list(dict.fromkeys([fee, 10000, 500, 100, 2500]))  # Try requested fee first, then 1% (working), then others
 
-        # Test quoter contract initialization
+        # The cached factory lookup proves which tiers have a deployed pool,
+        # so tiers without one never reach the quoter at all
         try:
-            quoter_contract = w3.eth.contract(address=w3.to_checksum_address(PANCAKESWAP_V3_QUOTER_ADDRESS), abi=QUOTER_V2_ABI)
-            logger.info(f"Quoter contract initialized successfully: {PANCAKESWAP_V3_QUOTER_ADDRESS}")
-        except Exception as contract_error:
-            logger.error(f"Failed to initialize quoter contract: {contract_error}")
+            active_fees = {pool_fee for pool_fee, _ in get_pools(TOKEN_ADDR, WBNB_ADDR)}
+            fee_tiers_to_try = [f for f in fee_tiers_to_try if f in active_fees]
+        except Exception:
+            logger.debug("Pool lookup failed; quoting all candidate tiers", exc_info=True)
+
+        # Evaluate every candidate tier inside one aggregate3 eth_call with
+        # allowFailure=true -- tiers without liquidity come back as failed
+        # results instead of reverting the whole call -- and serve whichever
+        # successful tier prices best for the user
+        calls = [
+            (
+                QUOTER_ADDR,
+                True,
+                QUOTE_SINGLE_SELECTOR + abi_encode(
+                    [QUOTE_SINGLE_TYPE],
+                    [(TOKEN_ADDR, WBNB_ADDR, amount_in_wei, try_fee, 0)]
+                )
+            )
+            for try_fee in fee_tiers_to_try
+        ]
+        call_start = time.time()
+        results = multicall3(calls) if calls else []
+        call_duration = time.time() - call_start
+        logger.debug("Multicall quote for %d fee tiers completed in %.2f seconds", len(fee_tiers_to_try), call_duration)
+
+        best = None
+        for try_fee, (success, return_data) in zip(fee_tiers_to_try, results):
+            if not success or not return_data:
+                logger.debug("Quote failed for fee tier %s", try_fee)
+                continue
+            amount_out, sqrt_price_x96_after, initialized_ticks_crossed, gas_estimate = w3.codec.decode(
+                ["uint256", "uint160", "uint32", "uint256"],
+                return_data
+            )
+            if best is None or amount_out > best[1]:
+                best = (try_fee, amount_out, gas_estimate)
+
+        if best is not None:
+            try_fee, amount_out, gas_estimate = best
+
+            # Convert amount out from wei to readable format (18 decimals for
+            # WBNB). Float division is fine here: the value only feeds the
+            # human-readable strings, never the on-chain path.
+            amount_out_formatted = amount_out / WEI
+            logger.info("Quote successful with fee %s: amount_out=%s", try_fee, amount_out_formatted)
+
+            total_duration = time.time() - start_time
             return jsonify({
-                "error": "Failed to initialize quoter contract",
+                "amount_in": amount_in,
+                "amount_in_wei": amount_in_wei,
+                "amount_out": amount_out,
+                "amount_out_formatted": f"{amount_out_formatted:.6f} WBNB",
+                "fee": try_fee,
+                "fee_percentage": f"{try_fee/10000}%",
+                "gas_estimate": gas_estimate,
+                "price_impact": f"1 ASPECTA = {amount_out_formatted/amount_in_num:.8f} WBNB",
+                "dex": "PancakeSwap V3",
+                "note": f"Using {try_fee/10000}% fee tier (has liquidity)" if try_fee != fee else None,
                 "debug_info": {
-                    "quoter_address": PANCAKESWAP_V3_QUOTER_ADDRESS,
-                    "contract_error": str(contract_error)
+                    "total_duration": f"{total_duration:.2f}s",
+                    "call_duration": f"{call_duration:.2f}s",
+                    "successful_fee_tier": try_fee
                 }
-            }), 500
+            })
 
-        # Try different fee tiers in order of preference (1% has liquidity)
-        fee_tiers_to_try = [fee, 10000, 500, 100, 2500]  # Try requested fee first, then 1% (working), then others
-        
-        for try_fee in fee_tiers_to_try:
-            logger.info(f"Attempting quote with fee tier: {try_fee}")
-            try:
-                # Prepare the parameters for quoteExactInputSingle
-                params = {
-                    "tokenIn": w3.to_checksum_address(CONTRACT_ADDRESS),
-                    "tokenOut": w3.to_checksum_address(WBNB_ADDRESS),
-                    "fee": try_fee,
-                    "amountIn": amount_in_wei,
-                    "sqrtPriceLimitX96": 0
-                }
-                logger.info(f"Quote parameters: {params}")
-                
-                # Test network connectivity before making the call
-                try:
-                    test_block = w3.eth.block_number
-                    logger.info(f"Network test successful, current block: {test_block}")
-                except Exception as network_error:
-                    logger.error(f"Network connectivity test failed: {network_error}")
-                    return jsonify({
-                        "error": "Network connectivity issue",
-                        "debug_info": {
-                            "network_error": str(network_error),
-                            "rpc_endpoint": BNB_CHAIN_RPC
-                        }
-                    }), 500
-                
-                # Call the quoteExactInputSingle function
-                logger.info("Making quoteExactInputSingle call...")
-                call_start = time.time()
-                result = quoter_contract.functions.quoteExactInputSingle(params).call()
-                call_duration = time.time() - call_start
-                logger.info(f"Quote call completed in {call_duration:.2f} seconds")
-                
-                amount_out, sqrt_price_x96_after, initialized_ticks_crossed, gas_estimate = result
-                
-                # Convert amount out from wei to readable format (18 decimals for WBNB)
-                amount_out_formatted = amount_out / (10 ** 18)
-                logger.info(f"Quote successful with fee {try_fee}: amount_out={amount_out_formatted}")
-                
-                total_duration = time.time() - start_time
-                return jsonify({
-                    "amount_in": amount_in,
-                    "amount_in_wei": amount_in_wei,
-                    "amount_out": amount_out,
-                    "amount_out_formatted": f"{amount_out_formatted:.6f} WBNB",
-                    "fee": try_fee,
-                    "fee_percentage": f"{try_fee/10000}%",
-                    "gas_estimate": gas_estimate,
-                    "price_impact": f"1 ASPECTA = {amount_out_formatted/amount_in:.8f} WBNB",
-                    "dex": "PancakeSwap V3",
-                    "note": f"Using {try_fee/10000}% fee tier (has liquidity)" if try_fee != fee else None,
-                    "debug_info": {
-                        "total_duration": f"{total_duration:.2f}s",
-                        "call_duration": f"{call_duration:.2f}s",
-                        "successful_fee_tier": try_fee
-                    }
-                })
-                
-            except Exception as fee_error:
-                logger.warning(f"Quote failed for fee tier {try_fee}: {fee_error}")
-                logger.warning(f"Error type: {type(fee_error).__name__}")
-                # Continue to next fee tier if this one fails
-                continue
-        
         # If all fee tiers fail, return detailed error info
         total_duration = time.time() - start_time
         logger.error("No liquidity available in any fee tier after trying all options.")
@@ -261,9 +439,7 @@ def get_quote():
             "debug_info": {
                 "total_duration": f"{total_duration:.2f}s",
                 "fee_tiers_tried": fee_tiers_to_try,
-                "rpc_endpoint": BNB_CHAIN_RPC,
-                "web3_connected": w3.is_connected(),
-                "chain_id": w3.eth.chain_id if w3.is_connected() else None
+                "rpc_endpoint": BNB_CHAIN_RPC
             }
         }), 400
         
@@ -277,79 +453,58 @@ def get_quote():
                 "error_type": type(e).__name__,
                 "rpc_endpoint": BNB_CHAIN_RPC
             }
-        }), 500
+        }), error_status(e)
 
 @uniswap_bp.route("/approve", methods=["POST"])
 def approve_token():
     """Approve the PancakeSwap V3 Router to spend ASPECTA tokens"""
     logger.info("Approve token request received")
+    account_address = None
     try:
         data = request.get_json()
         private_key = data.get("private_key")
         account_address = data.get("account_address")
         amount = data.get("amount")
         
-        logger.info(f"Approve request: account={account_address}, amount={amount}")
+        logger.debug("Approve request: account=%s, amount=%s", account_address, amount)
         
         if not private_key or not account_address or not amount:
             logger.error("Missing required fields for approve")
             return jsonify({"error": "private_key, account_address, and amount are required"}), 400
         
-        if not w3.is_connected():
-            logger.error("Web3 not connected for approve")
-            return jsonify({"error": "Failed to connect to BNB Smart Chain"}), 500
-        
         # Convert amount to wei
-        amount_wei = int(amount * (10 ** 18))
-        logger.info(f"Amount in wei: {amount_wei}")
+        amount_wei = to_wei(amount)
+        logger.debug("Amount in wei: %s", amount_wei)
         
-        token_contract = w3.eth.contract(address=w3.to_checksum_address(CONTRACT_ADDRESS), abi=ERC20_ABI)
         account_address = w3.to_checksum_address(account_address)
-        nonce = w3.eth.get_transaction_count(account_address)
-        
-        logger.info(f"Account nonce: {nonce}")
-        
-        # Build the transaction
-        txn = token_contract.functions.approve(
-            w3.to_checksum_address(PANCAKESWAP_V3_ROUTER_ADDRESS),
-            amount_wei
-        ).build_transaction({
-            "chainId": w3.eth.chain_id,
+
+        # Nonce and gas price may each need an RPC when cold -- fetch them
+        # concurrently so the write path pays max(RTT) instead of the sum
+        nonce_future = _rpc_executor.submit(next_nonce, account_address)
+        gas_price_future = _rpc_executor.submit(get_gas_price)
+        nonce = nonce_future.result()
+
+        logger.debug("Account nonce: %s", nonce)
+
+        # Build the transaction with pre-encoded calldata
+        txn = {
+            "to": TOKEN_ADDR,
+            "data": APPROVE_SELECTOR + abi_encode(["address", "uint256"], [ROUTER_ADDR, amount_wei]),
+            "value": 0,
+            "chainId": get_chain_id(),
             "gas": 200000,
-            "gasPrice": w3.eth.gas_price,
+            "gasPrice": gas_price_future.result(),
             "nonce": nonce,
-        })
+        }
         
-        logger.info(f"Transaction built: {txn}")
+        logger.debug("Transaction built: %s", txn)
         
         # Sign the transaction
-        logger.info("Signing transaction...")
         signed_txn = w3.eth.account.sign_transaction(txn, private_key)
-        logger.info(f"Transaction signed, type: {type(signed_txn)}")
-        
-        # Fix for the rawTransaction attribute error
-        # In newer versions of web3.py, it might be \'raw_transaction\' instead of \'rawTransaction\'
-        raw_transaction = None
-        if hasattr(signed_txn, 'rawTransaction'):
-            raw_transaction = signed_txn.rawTransaction
-            logger.info("Using rawTransaction attribute")
-        elif hasattr(signed_txn, 'raw_transaction'):
-            raw_transaction = signed_txn.raw_transaction
-            logger.info("Using raw_transaction attribute")
-        else:
-            logger.error(f"Signed transaction object attributes: {dir(signed_txn)}")
-            return jsonify({
-                "error": "Unable to access raw transaction data",
-                "debug_info": {
-                    "signed_txn_type": str(type(signed_txn)),
-                    "available_attributes": [attr for attr in dir(signed_txn) if not attr.startswith('_')]
-                }
-            }), 500
         
         # Send the transaction
-        logger.info("Sending transaction...")
-        tx_hash = w3.eth.send_raw_transaction(raw_transaction)
-        logger.info(f"Transaction sent: {tx_hash.hex()}")
+        tx_hash = w3.eth.send_raw_transaction(getattr(signed_txn, RAW_TX_ATTR))
+        logger.info("Transaction sent: %s", tx_hash.hex())
         
         return jsonify({
             "success": True,
@@ -360,18 +515,129 @@ def approve_token():
             "dex": "PancakeSwap V3"
         })
     except Exception as e:
+        if account_address:
+            reset_nonce(account_address)
         logger.exception("Error in approve token")
         return jsonify({
             "error": str(e),
             "debug_info": {
                 "error_type": type(e).__name__
             }
-        }), 500
+        }), error_status(e)
+
+@uniswap_bp.route("/approve-tx", methods=["POST"])
+def build_approve_tx():
+    """Build an unsigned approve transaction for client-side signing.
+
+    Keeps the private key on the client: sign the returned fields locally
+    and submit the raw bytes to /broadcast.
+    """
+    logger.info("Approve-tx build request received")
+    try:
+        data = request.get_json()
+        account_address = data.get("account_address")
+        amount = data.get("amount")
+
+        if not account_address or not amount:
+            return jsonify({"error": "account_address and amount are required"}), 400
+
+        account_address = w3.to_checksum_address(account_address)
+        amount_wei = to_wei(amount)
+
+        nonce_future = _rpc_executor.submit(w3.eth.get_transaction_count, account_address, "pending")
+        gas_price_future = _rpc_executor.submit(get_gas_price)
+
+        calldata = APPROVE_SELECTOR + abi_encode(["address", "uint256"], [ROUTER_ADDR, amount_wei])
+        return jsonify({
+            "transaction": {
+                "to": TOKEN_ADDR,
+                "data": "0x" + calldata.hex(),
+                "value": 0,
+                "chainId": get_chain_id(),
+                "gas": 200000,
+                "gasPrice": gas_price_future.result(),
+                "nonce": nonce_future.result(),
+            },
+            "spender": ROUTER_ADDR,
+            "amount_wei": amount_wei,
+            "dex": "PancakeSwap V3"
+        })
+    except Exception as e:
+        logger.exception("Error building approve transaction")
+        return jsonify({"error": str(e)}), error_status(e)
+
+@uniswap_bp.route("/swap-tx", methods=["POST"])
+def build_swap_tx():
+    """Build an unsigned exactInputSingle swap transaction for client-side signing"""
+    logger.info("Swap-tx build request received")
+    try:
+        data = request.get_json()
+        account_address = data.get("account_address")
+        amount_in = data.get("amount_in")
+        amount_out_min = data.get("amount_out_min")
+        fee = data.get("fee")
+
+        if not all([account_address, amount_in, amount_out_min, fee]):
+            return jsonify({"error": "account_address, amount_in, amount_out_min, and fee are required"}), 400
+
+        account_address = w3.to_checksum_address(account_address)
+        amount_in_wei = to_wei(amount_in)
+        amount_out_min_wei = to_wei(amount_out_min)
+
+        nonce_future = _rpc_executor.submit(w3.eth.get_transaction_count, account_address, "pending")
+        gas_price_future = _rpc_executor.submit(get_gas_price)
+
+        swap_params = (
+            TOKEN_ADDR,
+            WBNB_ADDR,
+            fee,
+            account_address,
+            amount_in_wei,
+            amount_out_min_wei,
+            0
+        )
+        calldata = EXACT_INPUT_SINGLE_SELECTOR + abi_encode([EXACT_INPUT_SINGLE_TYPE], [swap_params])
+        return jsonify({
+            "transaction": {
+                "to": ROUTER_ADDR,
+                "data": "0x" + calldata.hex(),
+                "value": 0,
+                "chainId": get_chain_id(),
+                "gas": 500000,
+                "gasPrice": gas_price_future.result(),
+                "nonce": nonce_future.result(),
+            },
+            "amount_in_wei": amount_in_wei,
+            "amount_out_min_wei": amount_out_min_wei,
+            "dex": "PancakeSwap V3"
+        })
+    except Exception as e:
+        logger.exception("Error building swap transaction")
+        return jsonify({"error": str(e)}), error_status(e)
+
+@uniswap_bp.route("/broadcast", methods=["POST"])
+def broadcast_transaction():
+    """Broadcast a transaction that was signed on the client"""
+    logger.info("Broadcast request received")
+    try:
+        data = request.get_json()
+        raw_transaction = data.get("raw_transaction")
+
+        if not raw_transaction:
+            return jsonify({"error": "raw_transaction is required"}), 400
+
+        tx_hash = w3.eth.send_raw_transaction(raw_transaction)
+        logger.info("Broadcast transaction sent: %s", tx_hash.hex())
+        return jsonify({"success": True, "transaction_hash": tx_hash.hex()})
+    except Exception as e:
+        logger.exception("Error broadcasting transaction")
+        return jsonify({"error": str(e)}), error_status(e)
 
 @uniswap_bp.route("/swap", methods=["POST"])
 def swap_token():
     """Perform a token swap from ASPECTA to WBNB using PancakeSwap V3"""
     logger.info("Swap token request received")
+    account_address = None
     try:
         data = request.get_json()
         private_key = data.get("private_key")
@@ -380,33 +646,28 @@ def swap_token():
         amount_out_min = data.get("amount_out_min")
         fee = data.get("fee")
         
-        logger.info(f"Swap request: account={account_address}, amount_in={amount_in}, amount_out_min={amount_out_min}, fee={fee}")
+        logger.debug("Swap request: account=%s, amount_in=%s, amount_out_min=%s, fee=%s", account_address, amount_in, amount_out_min, fee)
         
         if not all([private_key, account_address, amount_in, amount_out_min, fee]):
             logger.error("Missing required fields for swap")
             return jsonify({"error": "private_key, account_address, amount_in, amount_out_min, and fee are required"}), 400
         
-        if not w3.is_connected():
-            logger.error("Web3 not connected for swap")
-            return jsonify({"error": "Failed to connect to BNB Smart Chain"}), 500
-        
         # Convert amounts to wei
-        amount_in_wei = int(amount_in * (10 ** 18))
-        amount_out_min_wei = int(amount_out_min * (10 ** 18))
+        amount_in_wei = to_wei(amount_in)
+        amount_out_min_wei = to_wei(amount_out_min)
         
         account_address = w3.to_checksum_address(account_address)
-        
-        # Get the current nonce for the account
-        nonce = w3.eth.get_transaction_count(account_address)
-        logger.info(f"Account nonce: {nonce}")
-        
-        # Get the router contract
-        router_contract = w3.eth.contract(address=w3.to_checksum_address(PANCAKESWAP_V3_ROUTER_ADDRESS), abi=ROUTER_ABI)
+
+        # Fetch the locally tracked nonce and the gas price concurrently
+        nonce_future = _rpc_executor.submit(next_nonce, account_address)
+        gas_price_future = _rpc_executor.submit(get_gas_price)
+        nonce = nonce_future.result()
+        logger.debug("Account nonce: %s", nonce)
         
         # Example parameters for exactInputSingle (PancakeSwap V3 Router)
         swap_params = (
-            w3.to_checksum_address(CONTRACT_ADDRESS),  # tokenIn
-            w3.to_checksum_address(WBNB_ADDRESS),      # tokenOut
+            TOKEN_ADDR,                                # tokenIn
+            WBNB_ADDR,                                 # tokenOut
             fee,                                       # fee
             account_address,                           # recipient
             amount_in_wei,                             # amountIn
@@ -414,41 +675,27 @@ def swap_token():
             0                                          # sqrtPriceLimitX96 (0 for no limit)
         )
         
-        logger.info(f"Swap parameters: {swap_params}")
-        
-        # Build the transaction
-        txn = router_contract.functions.exactInputSingle(swap_params).build_transaction({
-            "chainId": w3.eth.chain_id,
+        logger.debug("Swap parameters: %s", swap_params)
+
+        # Build the transaction with pre-encoded calldata
+        txn = {
+            "to": ROUTER_ADDR,
+            "data": EXACT_INPUT_SINGLE_SELECTOR + abi_encode([EXACT_INPUT_SINGLE_TYPE], [swap_params]),
+            "value": 0,
+            "chainId": get_chain_id(),
             "gas": 500000,  # Increased gas limit for swaps
-            "gasPrice": w3.eth.gas_price,
+            "gasPrice": gas_price_future.result(),
             "nonce": nonce,
-        })
+        }
         
-        logger.info(f"Swap transaction built: {txn}")
+        logger.debug("Swap transaction built: %s", txn)
         
         # Sign the transaction
         signed_txn = w3.eth.account.sign_transaction(txn, private_key)
         
-        # Fix for the rawTransaction attribute error (same as approve)
-        raw_transaction = None
-        if hasattr(signed_txn, 'rawTransaction'):
-            raw_transaction = signed_txn.rawTransaction
-        elif hasattr(signed_txn, 'raw_transaction'):
-            raw_transaction = signed_txn.raw_transaction
-        else:
-            logger.error(f"Signed transaction object attributes: {dir(signed_txn)}")
-            return jsonify({
-                "error": "Unable to access raw transaction data",
-                "debug_info": {
-                    "signed_txn_type": str(type(signed_txn)),
-                    "available_attributes": [attr for attr in dir(signed_txn) if not attr.startswith('_')]
-                }
-            }), 500
-        
         # Send the transaction
-        logger.info("Sending transaction...")
-        tx_hash = w3.eth.send_raw_transaction(raw_transaction)
-        logger.info(f"Swap transaction sent: {tx_hash.hex()}")
+        tx_hash = w3.eth.send_raw_transaction(getattr(signed_txn, RAW_TX_ATTR))
+        logger.info("Swap transaction sent: %s", tx_hash.hex())
         
         return jsonify({
             "success": True,
@@ -459,11 +706,13 @@ def swap_token():
             "dex": "PancakeSwap V3"
         })
     except Exception as e:
+        if account_address:
+            reset_nonce(account_address)
         logger.exception("Error in swap token")
         return jsonify({
             "error": str(e),
             "debug_info": {
                 "error_type": type(e).__name__
             }
-        }), 500
+        }), error_status(e)
 